@@ -4,7 +4,7 @@ AAU Helpdesk Chatbot - Main FastAPI Application
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Dict, List, Any, Optional
 import uvicorn
 import random
@@ -38,11 +38,17 @@ response_templates = ResponseTemplates()
 
 # Pydantic models
 class ChatRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     message: str
     user_id: Optional[str] = None
     session_id: Optional[str] = None
 
+# Built with model_construct() in /chat: the values come from the engine and
+# FastAPI validates the returned object against response_model anyway
 class ChatResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     response: str
     intent: str
     confidence: float
@@ -53,9 +59,13 @@ class ChatResponse(BaseModel):
     timestamp: str
 
 class TrainingRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     training_data: List[Dict[str, Any]]
 
 class EvaluationResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     intent_accuracy: float
     parameter_metrics: Dict[str, Dict[str, float]]
     total_samples: int
@@ -72,6 +82,9 @@ async def startup_event():
     training_data = DataLoader.get_sample_training_data()
     nlp_engine.train_intent_classifier(training_data)
     
+    # Compile response templates now rather than on the first chat turn
+    response_templates.warm_up()
+    
     logger.info("Chatbot initialized successfully!")
 
 @app.get("/")
@@ -96,7 +109,8 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "nlp_engine_trained": nlp_engine.intent_classifier.is_trained
+        "nlp_engine_trained": nlp_engine.intent_classifier.is_trained,
+        "response_cache": response_templates.cache_info()
     }
 
 @app.get("/intents")
@@ -119,7 +133,7 @@ async def chat(request: ChatRequest):
         
         # Handle greetings
         if _is_greeting(cleaned_message):
-            return ChatResponse(
+            return ChatResponse.model_construct(
                 response=get_greeting_response(),
                 intent="general_info",
                 confidence=1.0,
@@ -131,7 +145,7 @@ async def chat(request: ChatRequest):
         
         # Handle goodbyes
         if _is_goodbye(cleaned_message):
-            return ChatResponse(
+            return ChatResponse.model_construct(
                 response=get_goodbye_response(),
                 intent="general_info",
                 confidence=1.0,
@@ -154,7 +168,8 @@ async def chat(request: ChatRequest):
             intent=result['intent'],
             parameters=result['parameters'],
             missing_parameters=result['missing_parameters'],
-            confidence=result['confidence']
+            confidence=result['confidence'],
+            session_id=request.session_id
         )
         
         # News Retrieval (Assignment Feature)
@@ -199,7 +214,7 @@ async def chat(request: ChatRequest):
             # In production, save to database
             logger.info(f"Conversation: {conversation_log}")
         
-        return ChatResponse(
+        return ChatResponse.model_construct(
             response=response_text,
             intent=result['intent'],
             confidence=result['confidence'],
@@ -211,7 +226,7 @@ async def chat(request: ChatRequest):
         
     except Exception as e:
         logger.error(f"Error processing chat request: {e}")
-        return ChatResponse(
+        return ChatResponse.model_construct(
             response=response_templates.get_error_response(),
             intent="error",
             confidence=0.0,
@@ -316,47 +331,55 @@ async def evaluate_chatbot(test_data: List[Dict[str, Any]]):
         logger.error(f"Error evaluating chatbot: {e}")
         raise HTTPException(status_code=500, detail=f"Evaluation failed: {str(e)}")
 
+# Phrases that mark a message as a greeting or a goodbye
+_GREETING_PHRASES = ('hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening', 'greetings')
+_GOODBYE_PHRASES = ('bye', 'goodbye', 'see you', 'farewell', 'take care', 'thanks', 'thank you')
+
 def _is_greeting(text: str) -> bool:
     """Check if message is a greeting"""
-    greetings = ['hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening', 'greetings']
     text_lower = text.lower()
-    return any(greeting in text_lower for greeting in greetings)
+    return any(greeting in text_lower for greeting in _GREETING_PHRASES)
 
 def _is_goodbye(text: str) -> bool:
     """Check if message is a goodbye"""
-    goodbyes = ['bye', 'goodbye', 'see you', 'farewell', 'take care', 'thanks', 'thank you']
     text_lower = text.lower()
-    return any(goodbye in text_lower for goodbye in goodbyes)
+    return any(goodbye in text_lower for goodbye in _GOODBYE_PHRASES)
+
+# Greeting responses
+_GREETING_RESPONSES = (
+    "Hello! Welcome to AAU Helpdesk. How can I assist you today?",
+    "Hi there! I'm here to help with your AAU-related questions.",
+    "Greetings! What can I help you with regarding Addis Ababa University?",
+    "Good day! How may I be of service to you today?"
+)
+
+# Goodbye responses
+_GOODBYE_RESPONSES = (
+    "Goodbye! Feel free to return if you have more questions.",
+    "Have a great day! Contact us again if you need any help.",
+    "Bye! Best of luck with your studies at AAU.",
+    "Farewell! We're here 24/7 if you need assistance."
+)
+
+# Error responses
+_ERROR_RESPONSES = (
+    "I apologize, but I encountered an error processing your request. Please try again.",
+    "Something went wrong on my end. Could you please rephrase your question?",
+    "I'm having trouble understanding that right now. Please try again later.",
+    "An unexpected error occurred. Our team has been notified."
+)
 
 def get_greeting_response() -> str:
     """Get a random greeting response"""
-    responses = [
-        "Hello! Welcome to AAU Helpdesk. How can I assist you today?",
-        "Hi there! I'm here to help with your AAU-related questions.",
-        "Greetings! What can I help you with regarding Addis Ababa University?",
-        "Good day! How may I be of service to you today?"
-    ]
-    return random.choice(responses)
+    return random.choice(_GREETING_RESPONSES)
 
 def get_goodbye_response() -> str:
     """Get a random goodbye response"""
-    responses = [
-        "Goodbye! Feel free to return if you have more questions.",
-        "Have a great day! Contact us again if you need any help.",
-        "Bye! Best of luck with your studies at AAU.",
-        "Farewell! We're here 24/7 if you need assistance."
-    ]
-    return random.choice(responses)
+    return random.choice(_GOODBYE_RESPONSES)
 
 def get_error_response() -> str:
     """Get a random error response"""
-    responses = [
-        "I apologize, but I encountered an error processing your request. Please try again.",
-        "Something went wrong on my end. Could you please rephrase your question?",
-        "I'm having trouble understanding that right now. Please try again later.",
-        "An unexpected error occurred. Our team has been notified."
-    ]
-    return random.choice(responses)
+    return random.choice(_ERROR_RESPONSES)
 
 if __name__ == "__main__":
     uvicorn.run(
@@ -4,11 +4,15 @@ Handles intent recognition and parameter extraction with precision metrics
 """
 
 import re
-from typing import Dict, List, Tuple, Optional, Any
+import sys
+from collections import OrderedDict
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Pattern, Tuple, Optional, Any
 
 import spacy
 import torch
-from transformers import DistilBertTokenizer, DistilBertForSequenceClassification, Trainer, TrainingArguments
+from transformers import DistilBertTokenizerFast, DistilBertForSequenceClassification, Trainer, TrainingArguments
 from torch.utils.data import Dataset
 import numpy as np
 from sklearn.metrics import precision_score, recall_score, f1_score
@@ -25,6 +29,87 @@ except ImportError:
 # Removed out-of-domain detector - using simple confidence-based fallback instead
 
 
+# Required parameters for each intent
+_REQUIRED_PARAMS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    # Original intents
+    'admission_inquiry': ('department',),
+    'registration_help': ('semester', 'year'),
+    'fee_payment': ('fee_amount',),
+    'transcript_request': ('document_type',),
+    'grade_inquiry': ('semester', 'year'),
+    'course_information': ('department',),
+    'schedule_inquiry': ('semester', 'year'),
+    'document_request': ('document_type',),
+    'general_info': (),
+    'technical_support': (),
+    
+    # New granular intents
+    'undergraduate_admission': ('department',),
+    'graduate_admission': ('department',),
+    'gat_exam_inquiry': (),
+    'international_admission': (),
+    
+    'undergraduate_fee_inquiry': ('department',),
+    'graduate_fee_inquiry': ('department',),
+    'international_student_fees': (),
+    'payment_methods_inquiry': (),
+    
+    'course_catalog_inquiry': ('department',),
+    'prerequisite_inquiry': ('department',),
+    'academic_calendar_inquiry': ('year',),
+    
+    'exam_schedule_inquiry': ('semester', 'year'),
+    'grade_report_request': (),
+    
+    'official_transcript_request': ('document_type',),
+    'certificate_request': ('document_type',),
+    'student_id_services': (),
+    
+    'library_services_inquiry': (),
+    'accommodation_inquiry': (),
+    'campus_location_inquiry': (),
+    'facility_booking_inquiry': (),
+    
+    'thesis_submission_process': (),
+    'research_opportunity_inquiry': (),
+    
+    'readmission_inquiry': (),
+    'alumni_services_inquiry': (),
+    
+    'hospital_services_inquiry': (),
+    'book_center_inquiry': (),
+    'radio_station_inquiry': (),
+    'museum_services_inquiry': (),
+    'student_portal_inquiry': (),
+})
+
+
+# Patterns used outside the per-category pattern lists
+_FEE_AMOUNT_RE = re.compile(r'\b(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(birr|etb|usd|\$)?\b')
+_STUDENT_ID_RE = re.compile(r'\b(student\s*id|id\s*number|student\s*number)[\s:]*([a-zA-Z0-9/-]+)\b')
+_ORDINAL_SEMESTER_RE = re.compile(r'\b(1st|2nd|3rd|first|second|third)\s*semester\b', re.IGNORECASE)
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+_ORDINAL_YEAR_RE = re.compile(r'\b(\d+)(?:st|nd|rd|th)?\s*year\b', re.IGNORECASE)
+_FOUR_DIGITS_RE = re.compile(r'\b(\d{4})\b')
+_AMOUNT_RE = re.compile(r'\b(\d+(?:,\d{3})*(?:\.\d{2})?)\b')
+
+# Common abbreviations expanded during preprocessing
+_ABBREVIATIONS = {
+    'aau': 'addis ababa university',
+    'cs': 'computer science',
+    'eng': 'engineering',
+    'med': 'medicine',
+    'biz': 'business',
+    'econ': 'economics'
+}
+_ABBREVIATION_RE = re.compile(r'\b(' + '|'.join(_ABBREVIATIONS) + r')\b', re.IGNORECASE)
+
+
+def _compile_patterns(patterns: List[str]) -> List[Pattern[str]]:
+    """Compile case-insensitive parameter extraction patterns"""
+    return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+
 class IntentDataset(Dataset):
     """Dataset class for DistilBERT training"""
     
@@ -61,7 +146,7 @@ class IntentClassifier:
     
     def __init__(self):
         self.model_name = 'distilbert-base-uncased'
-        self.tokenizer = DistilBertTokenizer.from_pretrained(self.model_name)
+        self.tokenizer = DistilBertTokenizerFast.from_pretrained(self.model_name)
         self.model = None
         self.label_encoder = LabelEncoder()
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
@@ -129,6 +214,19 @@ class IntentClassifier:
             
         ]
         self.is_trained = False
+        
+        # Bounded LRU of cleaned text -> (label, confidence) for repeated questions
+        self.prediction_cache_size = 1024
+        self._prediction_cache = OrderedDict()
+        
+        # Decoded class labels indexed by model output id
+        self._class_labels = ()
+    
+    def _refresh_label_state(self):
+        """Rebuild the id -> label table and drop stale cached predictions"""
+        # Interned so downstream intent-keyed dict lookups hit the identity fast path
+        self._class_labels = tuple(sys.intern(str(label)) for label in self.label_encoder.classes_)
+        self._prediction_cache.clear()
     
     def train(self, texts: List[str], labels: List[str]):
         """Train the DistilBERT intent classifier"""
@@ -174,6 +272,7 @@ class IntentClassifier:
         self.save_model()
         
         self.is_trained = True
+        self._refresh_label_state()
         print("✅ DistilBERT training completed!")
     
     def save_model(self, model_dir='./trained_model'):
@@ -205,13 +304,14 @@ class IntentClassifier:
         try:
             # Load the model and tokenizer
             self.model = DistilBertForSequenceClassification.from_pretrained(model_dir).to(self.device)
-            self.tokenizer = DistilBertTokenizer.from_pretrained(model_dir)
+            self.tokenizer = DistilBertTokenizerFast.from_pretrained(model_dir)
             
             # Load the label encoder
             with open(f'{model_dir}/label_encoder.pkl', 'rb') as f:
                 self.label_encoder = pickle.load(f)
             
             self.is_trained = True
+            self._refresh_label_state()
             print(f"✅ Model loaded from {model_dir}")
             return True
         except Exception as e:
@@ -223,6 +323,11 @@ class IntentClassifier:
         if not self.is_trained:
             return 'general_info', 0.5
         
+        cached = self._prediction_cache.get(text)
+        if cached is not None:
+            self._prediction_cache.move_to_end(text)
+            return cached
+        
         # Tokenize input
         inputs = self.tokenizer(
             text,
@@ -237,26 +342,28 @@ class IntentClassifier:
         with torch.no_grad():
             outputs = self.model(**inputs)
             logits = outputs.logits
-            probabilities = torch.softmax(logits, dim=-1)
+            probabilities = torch.softmax(logits, dim=-1)[0]
             
-            predicted_class_id = torch.argmax(probabilities, dim=-1).item()
-            confidence = probabilities[0][predicted_class_id].item()
+            # Single reduction yields both the confidence and the class id
+            max_probability, predicted_class_id = torch.max(probabilities, dim=-1)
+            confidence = max_probability.item()
             
             # Decode label
-            predicted_label = self.label_encoder.inverse_transform([predicted_class_id])[0]
-            
+            predicted_label = self._class_labels[predicted_class_id.item()]
+        
+        self._prediction_cache[text] = (predicted_label, confidence)
+        if len(self._prediction_cache) > self.prediction_cache_size:
+            self._prediction_cache.popitem(last=False)
+        
         return predicted_label, confidence
 
 class ParameterExtractor:
     """Extract parameters using NER and rule-based methods"""
     
     def __init__(self):
-        # Load spaCy model (you'll need to download: python -m spacy download en_core_web_sm)
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("Warning: spaCy model not found. Install with: python -m spacy download en_core_web_sm")
-            self.nlp = None
+        # spaCy model is loaded lazily by the ``nlp`` property
+        self._nlp = None
+        self._nlp_loaded = False
         
         # AAU-specific patterns
         self.department_patterns = [
@@ -298,6 +405,30 @@ class ParameterExtractor:
             r'\b(sidist kilo|main campus|sefere selam|science campus|4 kilo|bishoftu)\b',
             r'\b(6 kilo|main|medical campus)\b',
         ]
+        
+        # Compile once; extract_parameters runs every pattern on each query
+        self.department_patterns = _compile_patterns(self.department_patterns)
+        self.document_patterns = _compile_patterns(self.document_patterns)
+        self.semester_patterns = _compile_patterns(self.semester_patterns)
+        self.year_patterns = _compile_patterns(self.year_patterns)
+        self.fee_patterns = _compile_patterns(self.fee_patterns)
+        self.student_type_patterns = _compile_patterns(self.student_type_patterns)
+        self.campus_patterns = _compile_patterns(self.campus_patterns)
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first use with only the NER components enabled"""
+        if not self._nlp_loaded:
+            self._nlp_loaded = True
+            # You'll need to download: python -m spacy download en_core_web_sm
+            try:
+                self._nlp = spacy.load(
+                    "en_core_web_sm",
+                    disable=["tagger", "parser", "lemmatizer", "attribute_ruler"]
+                )
+            except OSError:
+                print("Warning: spaCy model not found. Install with: python -m spacy download en_core_web_sm")
+        return self._nlp
     
     def extract_entities(self, text: str) -> Dict[str, List[str]]:
         """Extract named entities using spaCy"""
@@ -363,88 +494,35 @@ class ParameterExtractor:
                     return parameters
         
         # Regular parameter extraction (existing logic)
-        # Extract departments
-        departments = []
-        for pattern in self.department_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                if isinstance(matches[0], tuple):
-                    departments.extend([match[1].strip() for match in matches])
-                else:
-                    departments.extend(matches)
-        
+        departments = self._collect_matches(self.department_patterns, text_lower, lambda m: m[1].strip())
         if departments:
-            parameters['department'] = list(set(departments))
-        
-        # Extract document types
-        documents = []
-        for pattern in self.document_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            documents.extend(matches)
+            parameters['department'] = departments
         
+        documents = self._collect_matches(self.document_patterns, text_lower)
         if documents:
-            parameters['document_type'] = list(set(documents))
-        
-        # Extract semester information
-        semesters = []
-        for pattern in self.semester_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                if isinstance(matches[0], tuple):
-                    semesters.extend([' '.join(match) for match in matches])
-                else:
-                    semesters.extend(matches)
+            parameters['document_type'] = documents
         
+        semesters = self._collect_matches(self.semester_patterns, text_lower, ' '.join)
         if semesters:
-            parameters['semester'] = list(set(semesters))
-        
-        # Extract years
-        years = []
-        for pattern in self.year_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                if isinstance(matches[0], tuple):
-                    years.extend([match[1] if match[1] else match[0] for match in matches])
-                else:
-                    years.extend(matches)
+            parameters['semester'] = semesters
         
+        years = self._collect_matches(self.year_patterns, text_lower, lambda m: m[1] or m[0])
         if years:
-            parameters['year'] = list(set(years))
-        
-        # Extract fee amounts and payment methods
-        fees = []
-        for pattern in self.fee_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                if isinstance(matches[0], tuple):
-                    fees.extend([match[0] for match in matches if match[0]])
-                else:
-                    fees.extend(matches)
+            parameters['year'] = years
         
+        # Fee amounts and payment methods
+        fees = self._collect_matches(self.fee_patterns, text_lower, itemgetter(0), skip_empty=True)
         if fees:
-            parameters['fee_amount'] = list(set(fees))
-        
-        # Extract campus locations
-        campuses = []
-        for pattern in self.campus_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            campuses.extend(matches)
+            parameters['fee_amount'] = fees
         
+        campuses = self._collect_matches(self.campus_patterns, text_lower)
         if campuses:
-            parameters['campus'] = list(set(campuses))
-        
-        # Extract student type (international, refugee, etc.)
-        student_types = []
-        for pattern in self.student_type_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                if isinstance(matches[0], tuple):
-                    student_types.extend([match[0] for match in matches])
-                else:
-                    student_types.extend(matches)
+            parameters['campus'] = campuses
         
+        # Student type (international, refugee, etc.)
+        student_types = self._collect_matches(self.student_type_patterns, text_lower, itemgetter(0))
         if student_types:
-            parameters['student_type'] = list(set(student_types))
+            parameters['student_type'] = student_types
         
         # Extract named entities
         entities = self.extract_entities(text)
@@ -458,20 +536,40 @@ class ParameterExtractor:
         # Intent-specific parameter extraction
         if intent == 'fee_payment':
             # Look for fee amounts and payment methods
-            fee_pattern = r'\b(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(birr|etb|usd|\$)?\b'
-            fee_matches = re.findall(fee_pattern, text_lower)
+            fee_matches = _FEE_AMOUNT_RE.findall(text_lower)
             if fee_matches:
                 parameters['fee_amount'] = [match[0] for match in fee_matches]
         
         elif intent == 'transcript_request':
             # Look for student ID patterns
-            student_id_pattern = r'\b(student\s*id|id\s*number|student\s*number)[\s:]*([a-zA-Z0-9/-]+)\b'
-            id_matches = re.findall(student_id_pattern, text_lower)
+            id_matches = _STUDENT_ID_RE.findall(text_lower)
             if id_matches:
                 parameters['student_id'] = [match[1] for match in id_matches]
         
         return parameters
     
+    @staticmethod
+    def _collect_matches(patterns: List[Pattern[str]], text: str,
+                         flatten: Optional[Callable[[Tuple[str, ...]], str]] = None,
+                         skip_empty: bool = False) -> List[str]:
+        """Run each pattern over text and return the deduplicated matches
+        
+        Patterns with several groups yield tuples, which are reduced to a
+        single string with ``flatten``; with ``skip_empty`` the empty
+        results of that are dropped.
+        """
+        found = set()
+        for pattern in patterns:
+            matches = pattern.findall(text)
+            if not matches:
+                continue
+            if flatten is not None and isinstance(matches[0], tuple):
+                flattened = map(flatten, matches)
+                found.update(filter(None, flattened) if skip_empty else flattened)
+            else:
+                found.update(matches)
+        return list(found)
+    
     def _normalize_department_answer(self, text: str) -> Optional[str]:
         """Normalize a simple department answer"""
         text = text.strip()
@@ -523,7 +621,7 @@ class ParameterExtractor:
         text = text.strip()
         
         # Look for ordinal patterns first
-        ordinal_match = re.search(r'\b(1st|2nd|3rd|first|second|third)\s*semester\b', text, re.IGNORECASE)
+        ordinal_match = _ORDINAL_SEMESTER_RE.search(text)
         if ordinal_match:
             ordinal = ordinal_match.group(1).lower()
             if ordinal in ['1st', 'first']:
@@ -563,12 +661,12 @@ class ParameterExtractor:
     def _extract_year_from_answer(self, text: str) -> Optional[str]:
         """Extract year from a simple answer"""
         # Look for 4-digit year first
-        year_match = re.search(r'\b(20\d{2})\b', text)
+        year_match = _YEAR_RE.search(text)
         if year_match:
             return year_match.group(1)
         
         # Look for ordinal year patterns like "2nd year", "3rd year"
-        ordinal_match = re.search(r'\b(\d+)(?:st|nd|rd|th)?\s*year\b', text, re.IGNORECASE)
+        ordinal_match = _ORDINAL_YEAR_RE.search(text)
         if ordinal_match:
             year_num = int(ordinal_match.group(1))
             # Convert to actual year (assuming current academic year context)
@@ -576,7 +674,7 @@ class ParameterExtractor:
             return str(current_year - 4 + year_num)  # Rough conversion
         
         # Look for just numbers that could be years
-        number_match = re.search(r'\b(\d{4})\b', text)
+        number_match = _FOUR_DIGITS_RE.search(text)
         if number_match:
             year = int(number_match.group(1))
             if 2020 <= year <= 2030:  # Reasonable year range
@@ -602,7 +700,7 @@ class ParameterExtractor:
     def _extract_amount_from_answer(self, text: str) -> Optional[str]:
         """Extract fee amount from a simple answer"""
         # Look for numbers
-        amount_match = re.search(r'\b(\d+(?:,\d{3})*(?:\.\d{2})?)\b', text)
+        amount_match = _AMOUNT_RE.search(text)
         if amount_match:
             return amount_match.group(1)
         return None
@@ -670,8 +768,7 @@ class AAUNLPEngine:
                 parameters = merged_parameters
         
         # Determine if we have enough information
-        required_params = self._get_required_parameters(intent)
-        missing_params = [param for param in required_params if param not in parameters or not parameters[param]]
+        missing_params = [param for param in _REQUIRED_PARAMS.get(intent, ()) if not parameters.get(param)]
         
         return {
             'intent': intent,
@@ -686,79 +783,14 @@ class AAUNLPEngine:
     def _preprocess_text(self, text: str) -> str:
         """Clean and preprocess input text"""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # Expand common abbreviations
-        abbreviations = {
-            'aau': 'addis ababa university',
-            'cs': 'computer science',
-            'eng': 'engineering',
-            'med': 'medicine',
-            'biz': 'business',
-            'econ': 'economics'
-        }
+        text = ' '.join(text.split())
         
-        for abbr, full in abbreviations.items():
-            text = re.sub(r'\b' + abbr + r'\b', full, text, flags=re.IGNORECASE)
-        
-        return text
+        # Expand common abbreviations in a single pass
+        return _ABBREVIATION_RE.sub(lambda m: _ABBREVIATIONS[m.group(0).lower()], text)
     
-    def _get_required_parameters(self, intent: str) -> List[str]:
+    def _get_required_parameters(self, intent: str) -> Tuple[str, ...]:
         """Get required parameters for each intent"""
-        required_params = {
-            # Original intents
-            'admission_inquiry': ['department'],
-            'registration_help': ['semester', 'year'],
-            'fee_payment': ['fee_amount'],
-            'transcript_request': ['document_type'],
-            'grade_inquiry': ['semester', 'year'],
-            'course_information': ['department'],
-            'schedule_inquiry': ['semester', 'year'],
-            'document_request': ['document_type'],
-            'general_info': [],
-            'technical_support': [],
-            
-            # New granular intents
-            'undergraduate_admission': ['department'],
-            'graduate_admission': ['department'],
-            'gat_exam_inquiry': [],
-            'international_admission': [],
-            
-            'undergraduate_fee_inquiry': ['department'],
-            'graduate_fee_inquiry': ['department'],
-            'international_student_fees': [],
-            'payment_methods_inquiry': [],
-            
-            'course_catalog_inquiry': ['department'],
-            'prerequisite_inquiry': ['department'],
-            'academic_calendar_inquiry': ['year'],
-            
-            'exam_schedule_inquiry': ['semester', 'year'],
-            'grade_report_request': [],
-            
-            'official_transcript_request': ['document_type'],
-            'certificate_request': ['document_type'],
-            'student_id_services': [],
-            
-            'library_services_inquiry': [],
-            'accommodation_inquiry': [],
-            'campus_location_inquiry': [],
-            'facility_booking_inquiry': [],
-            
-            'thesis_submission_process': [],
-            'research_opportunity_inquiry': [],
-            
-            'readmission_inquiry': [],
-            'alumni_services_inquiry': [],
-            
-            'hospital_services_inquiry': [],
-            'book_center_inquiry': [],
-            'radio_station_inquiry': [],
-            'museum_services_inquiry': [],
-            'student_portal_inquiry': [],
-        }
-        
-        return required_params.get(intent, [])
+        return _REQUIRED_PARAMS.get(intent, ())
     
     def train_intent_classifier(self, training_data: List[Dict[str, str]]):
         """Train the intent classifier with labeled data"""
@@ -14,7 +14,7 @@ class OutOfDomainDetector:
     
     def __init__(self):
         # AAU domain keywords
-        self.domain_keywords = {
+        self.domain_keywords = frozenset({
             # University terms
             'aau', 'addis', 'ababa', 'university', 'college', 'school', 'faculty',
             'department', 'academic', 'student', 'campus', 'education',
@@ -40,7 +40,10 @@ class OutOfDomainDetector:
             # Administrative
             'office', 'contact', 'phone', 'email', 'address', 'location',
             'help', 'support', 'service', 'information', 'inquiry'
-        }
+        })
+        
+        # Word tokenizer used for keyword lookups
+        self._word_re = re.compile(r'\w+')
         
         # Out-of-domain patterns (regex)
         self.out_of_domain_patterns = [
@@ -110,34 +113,48 @@ class OutOfDomainDetector:
                 r'^\s*\d+\s*[\+\-\*\/]\s*\d+\s*=?\s*$'
             ]
         }
+        
+        # Compiled forms: a match anywhere in the union is equivalent to any
+        # single out-of-domain pattern matching, so one scan answers it.
+        # Topics stay separate because classify_topic honours their order.
+        self._out_of_domain_re = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in self.out_of_domain_patterns)
+        )
+        self._topic_res = [
+            (topic, re.compile('|'.join(f'(?:{pattern})' for pattern in patterns)))
+            for topic, patterns in self.topic_patterns.items()
+        ]
+        self._general_question_res = [
+            re.compile(r'^\s*(what|who|when|where|why|how)\s+is\s+\w+\s*\??\s*$'),
+            re.compile(r'^\s*(tell me about|explain|define)\s+\w+\s*$')
+        ]
     
-    def has_domain_keywords(self, text: str) -> bool:
+    def has_domain_keywords(self, text: str, text_lower: Optional[str] = None) -> bool:
         """Check if text contains AAU domain keywords"""
-        words = set(re.findall(r'\b\w+\b', text.lower()))
-        return len(words & self.domain_keywords) > 0
+        if text_lower is None:
+            text_lower = text.lower()
+        # Stop at the first domain word instead of building the full word set
+        return any(m.group(0) in self.domain_keywords for m in self._word_re.finditer(text_lower))
     
-    def detect_out_of_domain_patterns(self, text: str) -> bool:
+    def detect_out_of_domain_patterns(self, text: str, text_lower: Optional[str] = None) -> bool:
         """Check if text matches out-of-domain patterns"""
-        text_lower = text.lower()
-        
-        for pattern in self.out_of_domain_patterns:
-            if re.search(pattern, text_lower):
-                return True
-        
-        return False
+        if text_lower is None:
+            text_lower = text.lower()
+        return self._out_of_domain_re.search(text_lower) is not None
     
-    def classify_topic(self, text: str) -> Optional[str]:
+    def classify_topic(self, text: str, text_lower: Optional[str] = None) -> Optional[str]:
         """Classify the topic of out-of-domain text"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
-        for topic, patterns in self.topic_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    return topic
+        for topic, pattern in self._topic_res:
+            if pattern.search(text_lower):
+                return topic
         
         return 'general'
     
-    def detect(self, text: str, intent: str, confidence: float) -> Dict:
+    def detect(self, text: str, intent: str, confidence: float,
+               text_lower: Optional[str] = None) -> Dict:
         """
         Main detection method
         
@@ -160,12 +177,15 @@ class OutOfDomainDetector:
             }
         
         # Check 1: Very low intent confidence + no domain keywords
-        has_keywords = self.has_domain_keywords(text)
-        matches_patterns = self.detect_out_of_domain_patterns(text)
+        # Lowercase once and share it with every check below
+        if text_lower is None:
+            text_lower = text.lower()
+        has_keywords = self.has_domain_keywords(text, text_lower)
+        matches_patterns = self.detect_out_of_domain_patterns(text, text_lower)
         
         # Strong indicators of out-of-domain
         if matches_patterns:
-            topic = self.classify_topic(text)
+            topic = self.classify_topic(text, text_lower)
             return {
                 'is_out_of_domain': True,
                 'confidence_score': 0.9,
@@ -175,7 +195,7 @@ class OutOfDomainDetector:
         
         # Low confidence + no domain keywords = likely out of domain
         if confidence < 0.15 and not has_keywords:
-            topic = self.classify_topic(text)
+            topic = self.classify_topic(text, text_lower)
             return {
                 'is_out_of_domain': True,
                 'confidence_score': 0.7,
@@ -185,7 +205,7 @@ class OutOfDomainDetector:
         
         # Very low confidence even with some keywords
         if confidence < 0.05:
-            topic = self.classify_topic(text)
+            topic = self.classify_topic(text, text_lower)
             return {
                 'is_out_of_domain': True,
                 'confidence_score': 0.6,
@@ -194,14 +214,9 @@ class OutOfDomainDetector:
             }
         
         # Check for questions that are too general
-        general_question_patterns = [
-            r'^\s*(what|who|when|where|why|how)\s+is\s+\w+\s*\??\s*$',
-            r'^\s*(tell me about|explain|define)\s+\w+\s*$'
-        ]
-        
-        for pattern in general_question_patterns:
-            if re.search(pattern, text.lower()) and not has_keywords:
-                topic = self.classify_topic(text)
+        for pattern in self._general_question_res:
+            if pattern.search(text_lower) and not has_keywords:
+                topic = self.classify_topic(text, text_lower)
                 return {
                     'is_out_of_domain': True,
                     'confidence_score': 0.8,
@@ -0,0 +1,243 @@
+"""
+Rarely requested response templates for AAU Helpdesk Chatbot
+Imported by templates.py the first time one of these intents is needed
+"""
+
+from typing import Dict, Tuple
+
+
+COLD_TEMPLATES: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    # RESEARCH & GRADUATE INTENTS
+    'research_opportunity_inquiry': {
+        'complete': (
+            "**Research Opportunities at AAU**\n\n"
+            "**Current Opportunities:**\n"
+            "• EfD-Ethiopia Postdoctoral Fellowships (3 positions)\n"
+            "  - Climate Policy & Development\n"
+            "  - Sustainable Agriculture\n"
+            "  - Sustainable Energy Transition\n"
+            "  - Green Industrialization & Urbanization\n"
+            "• AAU Research Chair for Forced Displacement Studies\n"
+            "  - Small grants and mentorship\n"
+            "  - Postdoctoral fellowships\n"
+            "  - Methodology training\n\n"
+            "**Research Support:**\n"
+            "• Research awards and seed grants\n"
+            "• Collaborative research programs\n"
+            "• Publication support\n"
+            "• Training of Trainers (ToT) programs\n\n"
+            "**Research Focus Areas:**\n"
+            "• Sustainable development\n"
+            "• Climate change and migration\n"
+            "• Health entrepreneurship\n"
+            "• Indigenous knowledge systems\n\n"
+            "**Contact:** Research Office, AAU",
+        ),
+        'partial': (
+            "I can help with research opportunity information. Are you interested in postdoctoral positions, student research, or faculty opportunities?",
+            "AAU offers various research opportunities. Please specify your academic level and research interests."
+        )
+    },
+
+    'thesis_submission_process': {
+        'complete': (
+            "**Thesis/Dissertation Submission at AAU**\n\n"
+            "**Submission Requirements:**\n"
+            "• Completed thesis/dissertation\n"
+            "• Supervisor approval\n"
+            "• Committee review completion\n"
+            "• Plagiarism check certificate\n"
+            "• Required number of copies\n\n"
+            "**Fees:**\n"
+            "• Masters Thesis: 20,250-27,000 ETB (30 ECTS)\n"
+            "• PhD Dissertation: 15,000 ETB per semester\n"
+            "• Examination fees may apply\n\n"
+            "**Process:**\n"
+            "1. Complete thesis writing\n"
+            "2. Get supervisor approval\n"
+            "3. Submit to examination committee\n"
+            "4. Pay required fees\n"
+            "5. Schedule defense\n"
+            "6. Submit final copies\n\n"
+            "**Electronic Submission:** Available through AAU Digital Library\n"
+            "**Contact:** Graduate Programs Office, respective college",
+        ),
+        'partial': (
+            "I can help with thesis submission information. Are you submitting a Masters thesis or PhD dissertation?",
+            "Thesis submission involves several steps and fees. What specific aspect of the process do you need help with?"
+        )
+    },
+
+    # SPECIALIZED AAU SERVICE INTENTS
+    'hospital_services_inquiry': {
+        'complete': (
+            "**Tikur Anbessa Specialized Hospital (TASH)**\n\n"
+            "**Overview:**\n"
+            "• Ethiopia's largest referral hospital\n"
+            "• Serves over 1 million patients annually\n"
+            "• Located at Sefere Selam Campus\n"
+            "• State-of-the-art clinical services\n\n"
+            "**Services Available:**\n"
+            "• Emergency services\n"
+            "• Specialized medical departments\n"
+            "• Surgical services\n"
+            "• Diagnostic services\n"
+            "• Outpatient clinics\n"
+            "• Inpatient care\n\n"
+            "**Staff Health Services:**\n"
+            "• Regular health screening programs\n"
+            "• Hypertension and diabetes screening\n"
+            "• Specialized consultations\n"
+            "• Preventive care services\n\n"
+            "**Contact:** TASH Administration for specific service information",
+        ),
+        'partial': (
+            "I can help with hospital services information. Are you looking for patient services, staff health programs, or general hospital information?",
+            "Tikur Anbessa Hospital provides comprehensive medical services. What specific information do you need?"
+        )
+    },
+
+    'book_center_inquiry': {
+        'complete': (
+            "**AAU Book Center Services**\n\n"
+            "**About:**\n"
+            "• Founded in 1984\n"
+            "• Official bookshop for entire AAU\n"
+            "• Located on Main Campus\n\n"
+            "**Available Items:**\n"
+            "• Textbooks and reference materials\n"
+            "• Monographs and journals\n"
+            "• General-interest books and literature\n"
+            "• Technical books and bestsellers\n"
+            "• AAU Press publications\n"
+            "• Educational and office stationery\n"
+            "• Related academic supplies\n\n"
+            "**Special Features:**\n"
+            "• Books by Ethiopian and foreign authors\n"
+            "• Covers virtually all academic fields\n"
+            "• Special Book Fair prices during events\n"
+            "• Support for academic growth\n\n"
+            "**Services:** Sales, special orders, and academic resource support",
+        ),
+        'partial': (
+            "I can help with Book Center information. Are you looking for specific books, stationery, or general services?",
+            "The AAU Book Center offers textbooks and academic supplies. What specific items or services do you need?"
+        )
+    },
+
+    'alumni_services_inquiry': {
+        'complete': (
+            "**AAU Alumni Services**\n\n"
+            "**Alumni Benefits:**\n"
+            "• Alumni network access\n"
+            "• Career services and job postings\n"
+            "• Continuing education opportunities\n"
+            "• Library access privileges\n"
+            "• Alumni events and reunions\n\n"
+            "**Current Alumni Events:**\n"
+            "• Alumni Homecoming 2025: December 27, 2025 - January 2, 2026\n"
+            "• 75th Anniversary celebrations\n"
+            "• Distinguished lecture series\n"
+            "• Networking events\n\n"
+            "**Alumni Services:**\n"
+            "• Transcript services\n"
+            "• Employment verification\n"
+            "• Alumni directory access\n"
+            "• Mentorship programs\n\n"
+            "**Motto:** Once AAU, Always AAU\n"
+            "**Contact:** Alumni Relations Office",
+        ),
+        'partial': (
+            "I can help with alumni services information. Are you looking for events, benefits, or specific services?",
+            "AAU offers various alumni services. What specific information do you need?"
+        )
+    },
+
+    'facility_booking_inquiry': {
+        'complete': (
+            "**AAU Facility Booking Services**\n\n"
+            "**Available Facilities:**\n"
+            "• Conference rooms and meeting halls\n"
+            "• Ras Mekonnen Hall (Main Campus)\n"
+            "• Eshetu Chole Hall\n"
+            "• Mandela Hall\n"
+            "• Laboratory spaces\n"
+            "• Sports facilities\n"
+            "• Cultural Center venues\n\n"
+            "**Booking Process:**\n"
+            "1. Submit facility request form\n"
+            "2. Specify date, time, and purpose\n"
+            "3. Get approval from relevant office\n"
+            "4. Pay applicable fees\n"
+            "5. Confirm booking\n\n"
+            "**Requirements:**\n"
+            "• Valid AAU affiliation\n"
+            "• Event details and purpose\n"
+            "• Insurance (for large events)\n"
+            "• Setup and cleanup arrangements\n\n"
+            "**Contact:** Facilities Management Office",
+        ),
+        'partial': (
+            "I can help with facility booking. What type of facility or event space do you need?",
+            "AAU has various bookable facilities. Please specify your requirements."
+        )
+    },
+
+    'radio_station_inquiry': {
+        'complete': (
+            "**AAU Community Radio FM 99.4**\n\n"
+            "**About AAU Radio:**\n"
+            "• Frequency: FM 99.4\n"
+            "• Slogan: \"የማሕበረሰብ ድምፅ\" (Voice of the Community)\n"
+            "• Community-focused programming\n"
+            "• Educational content\n"
+            "• Student involvement opportunities\n\n"
+            "**Programming:**\n"
+            "• Academic discussions\n"
+            "• Community news and updates\n"
+            "• Cultural programs\n"
+            "• Student shows\n"
+            "• Educational content\n\n"
+            "**Get Involved:**\n"
+            "• Student volunteer opportunities\n"
+            "• Program hosting\n"
+            "• Content creation\n"
+            "• Technical training\n\n"
+            "**Follow:** @AAUFM99point4 on Telegram\n"
+            "**Contact:** AAU Radio Station for participation opportunities",
+        ),
+        'partial': (
+            "I can help with AAU Radio information. Are you interested in listening, participating, or general information?",
+            "AAU FM 99.4 is the community radio station. What would you like to know?"
+        )
+    },
+
+    'museum_services_inquiry': {
+        'complete': (
+            "**AAU Museums and Cultural Services**\n\n"
+            "**AAU Museums:**\n"
+            "• Ethnographic Museum (IES, Sidist Kilo Campus)\n"
+            "  - Ethiopia's first university museum (1950s)\n"
+            "  - Artifacts, traditional tools, historical heritage\n"
+            "• National Herbarium (Science Campus)\n"
+            "  - Mummified plants and animals\n"
+            "  - Endemic Ethiopian species\n\n"
+            "**Cultural Center:**\n"
+            "• Event hosting and exhibitions\n"
+            "• Book fairs and literary events\n"
+            "• Cultural performances\n"
+            "• Academic conferences\n\n"
+            "**Services:**\n"
+            "• Guided tours\n"
+            "• Educational programs\n"
+            "• Research access\n"
+            "• Cultural events\n\n"
+            "**Location:** Various campus locations\n"
+            "**Contact:** Museum services for tour arrangements",
+        ),
+        'partial': (
+            "I can help with museum and cultural services information. Are you interested in visits, exhibitions, or educational programs?",
+            "AAU has several museums and cultural facilities. What specific information do you need?"
+        )
+    }
+}
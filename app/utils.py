@@ -2,26 +2,80 @@
 Utility functions for AAU Helpdesk Chatbot
 """
 
+import atexit
+import copy
 import json
 import logging
+import os
+import queue
 import re
+import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-import pandas as pd
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Any, Optional
 from pathlib import Path
 
-# Configure logging
+# Parse JSON with orjson when it is installed; both accept the raw bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Configure logging; records are queued and written to the log file and
+# console on a background thread so callers never block on disk flushes
+_log_queue: 'queue.Queue[logging.LogRecord]' = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('aau_chatbot.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('aau_chatbot.log'),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by TextProcessor and ValidationUtils
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\-.,!?]')
+_NUMBER_RE = re.compile(r'\b\d+(?:,\d{3})*(?:\.\d+)?\b')
+_STUDENT_ID_RE = re.compile(r'^[A-Z]{2,3}/\d{4}/\d{2}$|^\d{6,8}$')
+
+# Common department abbreviations and variations
+_DEPARTMENT_MAPPINGS: Mapping[str, str] = MappingProxyType({
+    'cs': 'computer science',
+    'cse': 'computer science',
+    'comp sci': 'computer science',
+    'it': 'information technology',
+    'eng': 'engineering',
+    'med': 'medicine',
+    'biz': 'business',
+    'econ': 'economics',
+    'psych': 'psychology'
+})
+
+# Filters for the noisier training data sources
+_QUESTION_WORDS = ('how', 'what', 'where', 'when', 'need', 'want', 'help')
+_EXCLUDED_TELEGRAM_CHANNELS = frozenset({'@aau_confessions', '@ethio_confessions', '@ye_university_life'})
+_EXCLUDED_TELEGRAM_WORDS = ('sorrow', 'condolence', 'mourn', 'passed away', 'funeral', 'confession', 'disclaimer', 'patriarchy', 'homosexuality')
+
+def _is_question_like(text: str) -> bool:
+    """Check if text reads like a question or request for help"""
+    if '?' in text:
+        return True
+    text_lower = text.lower()
+    return any(word in text_lower for word in _QUESTION_WORDS)
+
 class DataLoader:
     """Load and manage training/test data"""
     
@@ -29,8 +83,8 @@ class DataLoader:
     def load_training_data(file_path: str) -> List[Dict[str, Any]]:
         """Load training data from JSON file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = _json_loads(f.read())
             logger.info(f"Loaded {len(data)} training samples from {file_path}")
             return data
         except FileNotFoundError:
@@ -43,13 +97,21 @@ class DataLoader:
     @staticmethod
     def get_sample_training_data() -> List[Dict[str, Any]]:
         """Generate sample training data for AAU helpdesk"""
+        # The data paths are relative, so the cache is keyed on the working
+        # directory; deep copy so callers can't mutate the cached samples
+        return copy.deepcopy(DataLoader._read_sample_training_data(os.getcwd()))
+    
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _read_sample_training_data(cwd: str) -> List[Dict[str, Any]]:
+        """Read all available training data sources under cwd once"""
         # Try to load all available training data sources
         all_data = []
         
         # Load new intents training data
         try:
-            with open('data/raw/new_intents_training_data.json', 'r', encoding='utf-8') as f:
-                new_intents_data = json.load(f)
+            with open('data/raw/new_intents_training_data.json', 'rb') as f:
+                new_intents_data = _json_loads(f.read())
                 all_data.extend(new_intents_data)
                 logger.info(f"Loaded {len(new_intents_data)} samples from new intents training data")
         except FileNotFoundError:
@@ -57,8 +119,8 @@ class DataLoader:
         
         # Load quality Q&A training data FIRST (highest priority)
         try:
-            with open('data/raw/quality_training_data.json', 'r', encoding='utf-8') as f:
-                quality_data = json.load(f)
+            with open('data/raw/quality_training_data.json', 'rb') as f:
+                quality_data = _json_loads(f.read())
                 all_data.extend(quality_data)
                 logger.info(f"Loaded {len(quality_data)} samples from quality Q&A data")
         except FileNotFoundError:
@@ -66,15 +128,14 @@ class DataLoader:
         
         # Load enhanced training data
         try:
-            with open('data/raw/enhanced_training_data.json', 'r', encoding='utf-8') as f:
-                enhanced_data = json.load(f)
+            with open('data/raw/enhanced_training_data.json', 'rb') as f:
                 # Filter out low-quality entries (hashtags, very short text, etc.)
-                filtered_enhanced = [
-                    item for item in enhanced_data 
-                    if len(item.get('text', '')) > 20 
-                    and not item.get('text', '').startswith('#')
-                    and ('?' in item.get('text', '') or any(word in item.get('text', '').lower() for word in ['how', 'what', 'where', 'when', 'need', 'want', 'help']))
-                ]
+                # while iterating, so the raw list is dropped once filtered
+                filtered_enhanced = []
+                for item in _json_loads(f.read()):
+                    text = item.get('text', '')
+                    if len(text) > 20 and not text.startswith('#') and _is_question_like(text):
+                        filtered_enhanced.append(item)
                 all_data.extend(filtered_enhanced)
                 logger.info(f"Loaded {len(filtered_enhanced)} samples from enhanced data")
         except FileNotFoundError:
@@ -82,11 +143,10 @@ class DataLoader:
         
         # Load telegram training data
         try:
-            with open('data/raw/telegram_training_data.json', 'r', encoding='utf-8') as f:
-                telegram_data = json.load(f)
+            with open('data/raw/telegram_training_data.json', 'rb') as f:
                 # Strict filtering for telegram data (often noisy/announcements)
                 filtered_telegram = []
-                for item in telegram_data:
+                for item in _json_loads(f.read()):
                     text = item.get('text', '')
                     # Skip if text is too short or too long
                     if len(text) < 10 or len(text) > 400:
@@ -97,11 +157,12 @@ class DataLoader:
                         continue
 
                     # Exclude known off-topic channels
-                    if item.get('channel') in ['@aau_confessions', '@ethio_confessions', '@ye_university_life']:
+                    if item.get('channel') in _EXCLUDED_TELEGRAM_CHANNELS:
                         continue
                         
                     # Skip obituary/announcement/confession keywords
-                    if any(word in text.lower() for word in ['sorrow', 'condolence', 'mourn', 'passed away', 'funeral', 'confession', 'disclaimer', 'patriarchy', 'homosexuality']):
+                    text_lower = text.lower()
+                    if any(word in text_lower for word in _EXCLUDED_TELEGRAM_WORDS):
                         continue
                     
                     # Accept it if it's not excluded above
@@ -114,8 +175,8 @@ class DataLoader:
         
         # Load other training data sources
         try:
-            with open('data/raw/aau_training_data.json', 'r', encoding='utf-8') as f:
-                aau_data = json.load(f)
+            with open('data/raw/aau_training_data.json', 'rb') as f:
+                aau_data = _json_loads(f.read())
                 all_data.extend(aau_data)
                 logger.info(f"Loaded {len(aau_data)} samples from AAU data")
         except FileNotFoundError:
@@ -178,6 +239,13 @@ class DataLoader:
                 "parameters": {}
             }
         ]
+
+@lru_cache(maxsize=256)
+def _normalize_department_name(department: str) -> str:
+    """Normalize department names (memoized)"""
+    department = department.strip().lower()
+    return _DEPARTMENT_MAPPINGS.get(department, department)
+
 class TextProcessor:
     """Text processing utilities"""
     
@@ -187,38 +255,53 @@ class TextProcessor:
         if not text:
             return ""
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        # Remove extra whitespace (split() drops the ends and runs in one C pass)
+        text = ' '.join(text.split())
         
         # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s\-.,!?]', '', text)
+        text = _SPECIAL_CHARS_RE.sub('', text)
         
         return text
     
     @staticmethod
     def extract_numbers(text: str) -> List[str]:
         """Extract numbers from text"""
-        return re.findall(r'\b\d+(?:,\d{3})*(?:\.\d+)?\b', text)
+        return _NUMBER_RE.findall(text)
     
     @staticmethod
     def normalize_department_name(department: str) -> str:
         """Normalize department names"""
-        department = department.lower().strip()
-        
-        # Common abbreviations and variations
-        mappings = {
-            'cs': 'computer science',
-            'cse': 'computer science',
-            'comp sci': 'computer science',
-            'it': 'information technology',
-            'eng': 'engineering',
-            'med': 'medicine',
-            'biz': 'business',
-            'econ': 'economics',
-            'psych': 'psychology'
-        }
-        
-        return mappings.get(department, department)
+        return _normalize_department_name(department)
+
+@lru_cache(maxsize=1024)
+def _validate_student_id(student_id: str) -> bool:
+    """Validate student ID format (memoized)"""
+    return bool(_STUDENT_ID_RE.match(student_id.upper()))
+
+class _YearWindow(NamedTuple):
+    """Current year and the timestamp at which the next one starts"""
+    year: int
+    ends_at: float
+
+_year_window = _YearWindow(0, 0.0)
+
+def _current_year() -> int:
+    """Get the current year, reading the calendar again only once it rolls over"""
+    global _year_window
+    window = _year_window
+    if time.time() >= window.ends_at:
+        year = datetime.now().year
+        window = _year_window = _YearWindow(year, datetime(year + 1, 1, 1).timestamp())
+    return window.year
+
+@lru_cache(maxsize=256)
+def _validate_year(year: str, current_year: int) -> bool:
+    """Validate academic year against the given current year (memoized)"""
+    try:
+        year_int = int(year)
+        return 2000 <= year_int <= current_year + 2
+    except ValueError:
+        return False
 
 class ValidationUtils:
     """Validation utilities"""
@@ -226,18 +309,20 @@ class ValidationUtils:
     @staticmethod
     def validate_student_id(student_id: str) -> bool:
         """Validate student ID format"""
-        pattern = r'^[A-Z]{2,3}/\d{4}/\d{2}$|^\d{6,8}$'
-        return bool(re.match(pattern, student_id.upper()))
+        return _validate_student_id(student_id)
     
     @staticmethod
     def validate_year(year: str) -> bool:
         """Validate academic year"""
-        try:
-            year_int = int(year)
-            current_year = datetime.now().year
-            return 2000 <= year_int <= current_year + 2
-        except ValueError:
-            return False
+        # The current year is part of the cache key so results roll over
+        # with the calendar
+        return _validate_year(year, _current_year())
+
+@lru_cache(maxsize=16)
+def _read_config_file(config_file: str, mtime: float) -> Dict[str, Any]:
+    """Parse a configuration file (memoized per file version)"""
+    with open(config_file, 'rb') as f:
+        return _json_loads(f.read())
 
 class ConfigManager:
     """Manage configuration settings"""
@@ -260,12 +345,16 @@ class ConfigManager:
         }
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            return {**default_config, **config}
+            # The modification time is part of the cache key, so an edited
+            # file is parsed again while an unchanged one is parsed only once
+            mtime = os.path.getmtime(self.config_file)
+            config = _read_config_file(self.config_file, mtime)
         except FileNotFoundError:
             logger.info(f"Config file not found, using defaults")
             return default_config
+        
+        # Deep copy so no two instances share the cached (nested) values
+        return {**default_config, **copy.deepcopy(config)}
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
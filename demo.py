@@ -10,16 +10,16 @@ from pathlib import Path
 # Add app directory to path
 sys.path.insert(0, str(Path(__file__).parent / 'app'))
 
-from nlp_engine import AAUNLPEngine
-from templates import ResponseTemplates
-from utils import DataLoader
-
 def main():
     print("🤖 AAU Helpdesk Chatbot - Demo")
     print("=" * 50)
     
-    # Initialize components
+    # Initialize components (imported here so loading this module stays cheap)
     print("🔄 Initializing chatbot components...")
+    from nlp_engine import AAUNLPEngine
+    from templates import ResponseTemplates
+    from utils import DataLoader
+    
     engine = AAUNLPEngine()
     templates = ResponseTemplates()
     
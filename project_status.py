@@ -5,25 +5,22 @@ Shows the current status and capabilities of the implemented system
 """
 
 import json
+import os
 import sys
-from pathlib import Path
 
-def check_file_exists(file_path):
-    """Check if file exists and return status"""
-    return "✅" if Path(file_path).exists() else "❌"
-
-def get_file_size(file_path):
-    """Get file size in a readable format"""
+def get_file_status(file_path):
+    """Check if file exists and get its size in a readable format (one stat call)"""
     try:
-        size = Path(file_path).stat().st_size
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        else:
-            return f"{size / (1024 * 1024):.1f} MB"
-    except:
-        return "N/A"
+        size = os.stat(file_path).st_size
+    except OSError:
+        return "❌", "N/A"
+    
+    if size < 1024:
+        return "✅", f"{size} B"
+    elif size < 1024 * 1024:
+        return "✅", f"{size / 1024:.1f} KB"
+    else:
+        return "✅", f"{size / (1024 * 1024):.1f} MB"
 
 def count_training_samples():
     """Count training samples from data files"""
@@ -58,8 +55,7 @@ def main():
     ]
     
     for file_path, description in core_files:
-        status = check_file_exists(file_path)
-        size = get_file_size(file_path)
+        status, size = get_file_status(file_path)
         print(f"  {status} {file_path:<25} - {description} ({size})")
     
     # Data Collection Scripts
@@ -70,8 +66,7 @@ def main():
     ]
     
     for file_path, description in script_files:
-        status = check_file_exists(file_path)
-        size = get_file_size(file_path)
+        status, size = get_file_status(file_path)
         print(f"  {status} {file_path:<25} - {description} ({size})")
     
     # Model Files
@@ -81,8 +76,7 @@ def main():
     ]
     
     for file_path, description in model_files:
-        status = check_file_exists(file_path)
-        size = get_file_size(file_path)
+        status, size = get_file_status(file_path)
         print(f"  {status} {file_path:<25} - {description} ({size})")
     
     # Test Files
@@ -92,8 +86,7 @@ def main():
     ]
     
     for file_path, description in test_files:
-        status = check_file_exists(file_path)
-        size = get_file_size(file_path)
+        status, size = get_file_status(file_path)
         print(f"  {status} {file_path:<25} - {description} ({size})")
     
     # Data Files
@@ -107,8 +100,7 @@ def main():
     ]
     
     for file_path, description in data_files:
-        status = check_file_exists(file_path)
-        size = get_file_size(file_path)
+        status, size = get_file_status(file_path)
         print(f"  {status} {file_path:<35} - {description} ({size})")
     
     # Configuration Files
@@ -121,8 +113,7 @@ def main():
     ]
     
     for file_path, description in config_files:
-        status = check_file_exists(file_path)
-        size = get_file_size(file_path)
+        status, size = get_file_status(file_path)
         print(f"  {status} {file_path:<25} - {description} ({size})")
     
     # Training Data Statistics
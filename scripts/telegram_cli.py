@@ -138,19 +138,27 @@ class TelegramDataCollector:
         return messages
     
     async def scrape_all_channels(self, limit: int = 500, 
-                                   days_back: int = 365) -> List[Dict[str, Any]]:
+                                   days_back: int = 365,
+                                   max_concurrent: int = 4) -> List[Dict[str, Any]]:
         """Scrape messages from all configured AAU channels"""
+        # Channels are fetched concurrently, at most max_concurrent at a time
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def scrape(channel: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    messages = await self.scrape_channel(channel, limit, days_back)
+                    # Small delay to avoid rate limiting
+                    await asyncio.sleep(1)
+                    return messages
+                except Exception as e:
+                    logger.error(f"Error with channel {channel}: {e}")
+                    return []
+        
+        # gather keeps the results in channel order
         all_messages = []
-        
-        for channel in self.aau_channels:
-            try:
-                messages = await self.scrape_channel(channel, limit, days_back)
-                all_messages.extend(messages)
-                # Small delay to avoid rate limiting
-                await asyncio.sleep(1)
-            except Exception as e:
-                logger.error(f"Error with channel {channel}: {e}")
-                continue
+        for messages in await asyncio.gather(*(scrape(channel) for channel in self.aau_channels)):
+            all_messages.extend(messages)
         
         return all_messages
     
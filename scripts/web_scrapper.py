@@ -8,7 +8,8 @@ from bs4 import BeautifulSoup
 import json
 import time
 import logging
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple
 from urllib.parse import urljoin, urlparse
 import re
 from pathlib import Path
@@ -30,6 +31,7 @@ class AAUWebScraper:
         })
         self.scraped_data = []
         self.delay = 1  # Delay between requests to be respectful
+        self.max_workers = 4  # Concurrent requests, kept low for the same reason
     
     def scrape_aau_pages(self) -> List[Dict[str, Any]]:
         """Scrape AAU website pages for relevant information"""
@@ -45,19 +47,25 @@ class AAUWebScraper:
             '/departments': 'course_information'
         }
         
-        for base_url in self.base_urls:
-            for page_path, intent in target_pages.items():
-                try:
-                    url = urljoin(base_url, page_path)
-                    content = self._scrape_page(url, intent)
-                    if content:
-                        scraped_content.extend(content)
-                    
-                    time.sleep(self.delay)
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping {url}: {e}")
-                    continue
+        pages = [(urljoin(base_url, page_path), intent)
+                 for base_url in self.base_urls
+                 for page_path, intent in target_pages.items()]
+        
+        def scrape(page: Tuple[str, str]) -> List[Dict[str, Any]]:
+            url, intent = page
+            try:
+                content = self._scrape_page(url, intent)
+                time.sleep(self.delay)
+                return content
+            except Exception as e:
+                logger.error(f"Error scraping {url}: {e}")
+                return []
+        
+        # Fetch pages on a small thread pool; each worker still pauses
+        # between its requests, and map keeps the results in page order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for content in executor.map(scrape, pages):
+                scraped_content.extend(content)
         
         return scraped_content
     
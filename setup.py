@@ -4,6 +4,8 @@ Setup script for AAU Helpdesk Chatbot
 Automates installation and initial setup
 """
 
+import compileall
+import importlib.util
 import subprocess
 import sys
 import os
@@ -35,14 +37,22 @@ def install_dependencies():
     """Install Python dependencies"""
     print("\n📦 Installing dependencies...")
     
-    # Install main dependencies
-    result = run_command("pip install -r requirements.txt", "Installing Python packages")
+    # Install main dependencies with this interpreter's pip, skipping the
+    # version check and progress output
+    result = run_command(
+        f'"{sys.executable}" -m pip install --disable-pip-version-check --quiet --no-input -r requirements.txt',
+        "Installing Python packages"
+    )
     if result is None:
         print("❌ Failed to install dependencies")
         return False
     
-    # Download spaCy model
-    result = run_command("python -m spacy download en_core_web_sm", "Downloading spaCy English model")
+    # Download spaCy model unless it is already installed
+    if importlib.util.find_spec("en_core_web_sm") is not None:
+        print("✅ spaCy English model already installed")
+        return True
+    
+    result = run_command(f'"{sys.executable}" -m spacy download en_core_web_sm', "Downloading spaCy English model")
     if result is None:
         print("⚠️  spaCy model download failed - NER features may be limited")
     
@@ -117,6 +127,17 @@ def create_config_file():
     
     print(f"✅ Configuration saved to {config_path}")
 
+def precompile_modules():
+    """Byte-compile the app so the first import loads the template data from cache"""
+    print("\n⚡ Precompiling application modules...")
+    
+    # The .pyc files store the template strings marshalled, so importing
+    # templates.py no longer has to parse its large literals on first start
+    if compileall.compile_dir('app', quiet=1):
+        print("✅ Application modules precompiled")
+    else:
+        print("⚠️  Some modules failed to compile")
+
 def run_tests():
     """Run basic tests to verify installation"""
     print("\n🧪 Running basic tests...")
@@ -198,6 +219,9 @@ def main():
     # Create config file
     create_config_file()
     
+    # Precompile modules
+    precompile_modules()
+    
     # Run tests
     if not run_tests():
         print("⚠️  Setup completed but tests failed - check installation")
@@ -4,6 +4,7 @@ Comprehensive tests for AAU Helpdesk Chatbot
 
 import pytest
 import json
+import os
 import sys
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -14,7 +15,7 @@ from app.main import get_greeting_response, get_goodbye_response, get_error_resp
 sys.path.append(str(Path(__file__).parent.parent / 'app'))
 
 from nlp_engine import AAUNLPEngine, IntentClassifier, ParameterExtractor
-from templates import ResponseTemplates
+from templates import ResponseTemplates, _initialize_templates, _validate_templates
 from utils import DataLoader, TextProcessor, ValidationUtils, ConfigManager
 
 class TestIntentClassifier:
@@ -56,6 +57,61 @@ class TestIntentClassifier:
         assert intent == "general_info"
         assert confidence == 0.5
 
+class TestPredictionCache:
+    """Test the intent classifier's prediction cache"""
+    
+    def setup_method(self):
+        """Setup a trained classifier with a stubbed tokenizer and model"""
+        with patch('nlp_engine.DistilBertTokenizerFast'):
+            self.classifier = IntentClassifier()
+        self.classifier.tokenizer = Mock(return_value=Mock(to=Mock(return_value={})))
+        self.classifier.model = self.stub_model(0)
+        self.classifier.label_encoder.fit(["fee_payment", "general_info"])
+        self.classifier.is_trained = True
+        self.classifier._refresh_label_state()
+    
+    @staticmethod
+    def stub_model(predicted_id):
+        """Build a model stub whose logits favour the given class id"""
+        import torch
+        logits = [[0.0, 0.0]]
+        logits[0][predicted_id] = 2.0
+        return Mock(return_value=Mock(logits=torch.tensor(logits)))
+    
+    def test_retraining_clears_cached_predictions(self):
+        """Test that a retrained model is not shadowed by cached predictions"""
+        model = self.classifier.model
+        assert self.classifier.predict("pay my fees")[0] == "fee_payment"
+        assert self.classifier.predict("pay my fees")[0] == "fee_payment"
+        assert model.call_count == 1
+        
+        retrained_model = self.stub_model(1)
+        with patch('nlp_engine.DistilBertForSequenceClassification') as model_class, \
+             patch('nlp_engine.IntentDataset'), patch('nlp_engine.TrainingArguments'), \
+             patch('nlp_engine.Trainer'), patch.object(self.classifier, 'save_model'):
+            model_class.from_pretrained.return_value.to.return_value = retrained_model
+            self.classifier.train(["pay my fees", "hello"], ["fee_payment", "general_info"])
+        
+        assert self.classifier.predict("pay my fees")[0] == "general_info"
+        assert retrained_model.call_count == 1
+    
+    def test_least_recently_used_prediction_is_evicted(self):
+        """Test that a full cache drops the least recently used text"""
+        self.classifier.prediction_cache_size = 2
+        model = self.classifier.model
+        
+        self.classifier.predict("a")
+        self.classifier.predict("b")
+        self.classifier.predict("a")  # Hit; "b" is now least recently used
+        self.classifier.predict("c")
+        assert list(self.classifier._prediction_cache) == ["a", "c"]
+        assert model.call_count == 3
+        
+        self.classifier.predict("a")
+        assert model.call_count == 3
+        self.classifier.predict("b")
+        assert model.call_count == 4
+
 class TestParameterExtractor:
     """Test parameter extraction functionality"""
     
@@ -108,6 +164,14 @@ class TestParameterExtractor:
         params = self.extractor.extract_parameters("", "general_info")
         assert isinstance(params, dict)
 
+    def test_empty_matches_kept_except_fees(self):
+        """Test that only fee extraction drops empty pattern matches"""
+        params = self.extractor.extract_parameters("the school of  ", "general_info")
+        assert params["department"] == [""]
+
+        params = self.extractor.extract_parameters("pay 5000 birr", "fee_payment")
+        assert params["fee_amount"] == ["5000"]
+
 class TestAAUNLPEngine:
     """Test main NLP engine"""
     
@@ -210,6 +274,57 @@ class TestResponseTemplates:
         # Should ask for clarification
         assert any(word in response.lower() for word in ["clarify", "understand", "rephrase"])
     
+    def test_cold_intent_templates(self):
+        """Test rarely used intents load on demand with valid templates"""
+        response = self.templates.generate_response(
+            intent="museum_services_inquiry",
+            parameters={},
+            missing_parameters=[],
+            confidence=0.8
+        )
+        
+        assert "Museum" in response
+        _validate_templates(_initialize_templates())
+
+    def test_cold_intents_in_template_views(self):
+        """Test membership, get, len and iteration include the cold intents"""
+        templates = _initialize_templates()
+
+        assert "museum_services_inquiry" in templates
+        assert templates.get("museum_services_inquiry") is not None
+        assert templates.get("unknown_intent") is None
+        assert len(templates) == len(list(templates)) == len(templates.keys()) == 40
+        assert "museum_services_inquiry" in list(templates)
+    
+    def test_session_keeps_phrasing(self):
+        """Test that a session gets the same phrasing on every call"""
+        for session_id in ("session-a", "session-b"):
+            responses = {
+                self.templates.generate_response(
+                    intent="undergraduate_admission",
+                    parameters={"department": ["computer science"]},
+                    missing_parameters=[],
+                    confidence=0.8,
+                    session_id=session_id
+                )
+                for _ in range(10)
+            }
+            assert len(responses) == 1
+    
+    def test_no_session_picks_random_phrasing(self):
+        """Test that calls without a session still choose variants at random"""
+        responses = {
+            self.templates.generate_response(
+                intent="undergraduate_admission",
+                parameters={"department": ["computer science"]},
+                missing_parameters=[],
+                confidence=0.8,
+                session_id=None
+            )
+            for _ in range(100)
+        }
+        assert len(responses) > 1
+    
     def test_greeting_response(self):
         """Test greeting response"""
         response = get_greeting_response()
@@ -245,7 +360,20 @@ class TestDataLoader:
             assert isinstance(item["text"], str)
             assert isinstance(item["intent"], str)
             assert isinstance(item["parameters"], dict)
-    
+
+    def test_sample_training_data_not_shared(self):
+        """Test that edits to returned samples don't leak into later calls"""
+        data = DataLoader.get_sample_training_data()
+        text = data[0]["text"]
+        data[0]["text"] = "changed"
+        data[0]["parameters"]["changed"] = True
+        data.append({"text": "extra", "intent": "extra", "parameters": {}})
+
+        fresh = DataLoader.get_sample_training_data()
+        assert fresh[0]["text"] == text
+        assert "changed" not in fresh[0]["parameters"]
+        assert len(fresh) == len(data) - 1
+
     def test_load_nonexistent_file(self):
         """Test loading non-existent training file"""
         data = DataLoader.load_training_data("nonexistent_file.json")
@@ -308,6 +436,27 @@ class TestValidationUtils:
         
         assert ValidationUtils.validate_year(future_year) == True
         assert ValidationUtils.validate_year(far_future_year) == False
+    
+    def test_validate_year_follows_current_year(self):
+        """Test that the upper bound rolls over with the calendar"""
+        from datetime import datetime
+        import utils
+        with patch('utils.datetime', wraps=datetime) as mock_datetime, \
+                patch('utils.time') as mock_time, \
+                patch('utils._year_window', utils._YearWindow(0, 0.0)):
+            mock_datetime.now.return_value = datetime(2030, 12, 31)
+            mock_time.time.return_value = datetime(2030, 12, 31).timestamp()
+            assert ValidationUtils.validate_year("2032") == True
+            assert ValidationUtils.validate_year("2033") == False
+            
+            # The calendar is only read again once the cached year has ended
+            mock_datetime.now.return_value = datetime(2031, 1, 1)
+            assert ValidationUtils.validate_year("2033") == False
+            assert mock_datetime.now.call_count == 1
+            
+            mock_time.time.return_value = datetime(2031, 1, 1).timestamp()
+            assert ValidationUtils.validate_year("2033") == True
+            assert mock_datetime.now.call_count == 2
 
 class TestConfigManager:
     """Test configuration management"""
@@ -326,6 +475,29 @@ class TestConfigManager:
         
         value = config.get("nonexistent_key", "default_value")
         assert value == "default_value"
+    
+    def test_config_instances_do_not_share_nested_values(self, tmp_path):
+        """Test that mutating one instance's config leaves other instances alone"""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"model_settings": {"use_spacy": True}}))
+        
+        for path in (str(config_file), str(tmp_path / "missing.json")):
+            first = ConfigManager(path)
+            first.config["model_settings"]["use_spacy"] = False
+            
+            second = ConfigManager(path)
+            assert second.get("model_settings")["use_spacy"] == True
+    
+    def test_config_reloads_edited_file(self, tmp_path):
+        """Test that a rewritten config file is read again"""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"confidence_threshold": 0.7}))
+        os.utime(config_file, (1_000_000_000, 1_000_000_000))
+        assert ConfigManager(str(config_file)).get("confidence_threshold") == 0.7
+        
+        config_file.write_text(json.dumps({"confidence_threshold": 0.9}))
+        os.utime(config_file, (1_000_000_100, 1_000_000_100))
+        assert ConfigManager(str(config_file)).get("confidence_threshold") == 0.9
 
 class TestIntegration:
     """Integration tests"""